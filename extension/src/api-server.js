@@ -360,9 +360,24 @@ class ChromeNativeServer {
   }
 
   handleNativeMessage(message) {
+    // The host coalesces bursts into batch envelopes; unwrap and handle
+    // each item so batched requests (and control replies) are not dropped
+    if (message.type === 'batch') {
+      for (const item of message.items || []) {
+        this.handleNativeMessage(item);
+      }
+      return;
+    }
+
     if (message.type === 'http_request') {
       this.handleHttpRequest(message, (response) => {
-        this.nativePort.postMessage(response);
+        // Echo the request id so the host can resolve the matching
+        // pending future; without it the reply is unroutable
+        this.nativePort.postMessage({
+          type: 'http_response',
+          id: message.id,
+          ...response
+        });
       });
     }
   }
@@ -396,24 +411,28 @@ class ChromeNativeServer {
         }
       };
 
+      // Buffer writeHead and reply exactly once on end; firing the
+      // callback from writeHead would send a second (empty) response
+      // for the same request id
+      let responseStatus = 200;
+      let responseHeaders = { 'Content-Type': 'application/json' };
+      let responded = false;
+
       const mockRes = {
         writeHead: (status, headers) => {
-          callback({
-            status,
-            headers: headers || {},
-            body: ''
-          });
+          responseStatus = status;
+          responseHeaders = headers || {};
         },
         end: (responseBody) => {
-          if (typeof callback === 'function') {
-            const currentCallback = callback;
-            callback = () => {};
-            currentCallback({
-              status: 200,
-              headers: { 'Content-Type': 'application/json' },
-              body: responseBody || ''
-            });
+          if (responded) {
+            return;
           }
+          responded = true;
+          callback({
+            status: responseStatus,
+            headers: responseHeaders,
+            body: responseBody || ''
+          });
         }
       };
 
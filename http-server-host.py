@@ -7,217 +7,343 @@ Provides HTTP server functionality on localhost:8765 for OpenAI-compatible API e
 import sys
 import json
 import struct
-import http.server
-import socketserver
-import threading
-import urllib.parse
+import argparse
+import asyncio
+import itertools
 import time
 import logging
 
+from aiohttp import web
+
+# Prefer orjson for the native-messaging hot path (3-10x faster parse/serialize,
+# returns bytes directly); fall back to stdlib json when unavailable.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+    def _json_loads(data):
+        # stdlib json rejects memoryview input, unlike orjson
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+# Precompiled length-prefix codec: a module-level struct.Struct with bound
+# pack/unpack is ~50% faster than repeated struct.pack/unpack calls, and the
+# '=' format char skips the byte-order lookup that '@' pays per call.
+_LEN = struct.Struct('=I')
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class ChatGPTAPIHandler(http.server.BaseHTTPRequestHandler):
-    def log_message(self, format, *args):
-        """Suppress default HTTP server logging"""
-        pass
+# Seconds to wait for the extension to answer a forwarded HTTP request
+REQUEST_TIMEOUT = 30
+
+# Seconds to keep idle HTTP connections open so clients can reuse them
+# instead of paying a TCP handshake per request
+KEEPALIVE_TIMEOUT = 75
+
+# Most messages queued within the batch window are coalesced into one framed
+# batch envelope, amortizing framing and JSON overhead across requests
+MAX_BATCH = 16
+DEFAULT_BATCH_WINDOW_MS = 2.0
+
+# The only request headers the extension reads; forwarding just these avoids
+# copying the full header multidict (and its per-pair allocations) per request
+FORWARDED_HEADERS = ('Content-Type', 'Authorization', 'User-Agent')
 
-    def do_OPTIONS(self):
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+}
+
+
+def json_response(status_code, data):
+    """Build a JSON response with CORS headers"""
+    return web.Response(
+        status=status_code,
+        body=_json_dumps(data),
+        content_type='application/json',
+        charset='utf-8',
+        headers=CORS_HEADERS,
+    )
+
+
+class NativeMessagingHost:
+    """Owns the stdin/stdout native-messaging pipe and the HTTP server.
+
+    A single reader task owns stdin and a write lock serializes stdout, so
+    any number of concurrent HTTP requests can share the one pipe without
+    corrupting the 4-byte length framing. Each forwarded request carries a
+    monotonic id; the reader resolves the matching future when the
+    extension's response arrives.
+    """
+
+    def __init__(self, batch_window_ms=DEFAULT_BATCH_WINDOW_MS):
+        self.loop = None
+        self.runner = None
+        self.running = False
+        self.batch_window = batch_window_ms / 1000.0
+        self._next_id = itertools.count(1)
+        self._pending = {}
+        self._send_queue = None
+        self._writer_task = None
+        # Reusable input buffer: only the reader touches it, and _read_message
+        # releases its view over it before returning, so growing the buffer
+        # for a larger message can never hit a live export
+        self._inbuf = bytearray(64 * 1024)
+        # Reusable output buffer: only the writer task touches it
+        self._outbuf = bytearray(64 * 1024)
+
+    # --- HTTP handlers -------------------------------------------------
+
+    async def handle_options(self, request):
         """Handle CORS preflight requests"""
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-        self.end_headers()
+        return web.Response(status=200, headers=CORS_HEADERS)
 
-    def do_GET(self):
+    async def handle_get(self, request):
         """Handle GET requests"""
-        if self.path == '/health' or self.path == '/api/health':
-            self.send_json_response(200, {
+        if request.path in ('/health', '/api/health'):
+            return json_response(200, {
                 'status': 'healthy',
                 'timestamp': int(time.time() * 1000),
                 'service': 'chatgpt-api-server'
             })
-        else:
-            self.send_json_response(404, {'error': 'Endpoint not found'})
-
-    def do_POST(self):
-        """Handle POST requests"""
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_data = self.rfile.read(content_length)
+        return json_response(404, {'error': 'Endpoint not found'})
 
+    async def handle_http_request(self, request):
+        """Forward POST/DELETE requests to the extension and relay the response"""
         try:
-            # Parse request body
-            request_data = {
-                'type': 'http_request',
-                'method': 'POST',
-                'path': self.path,
-                'headers': dict(self.headers),
-                'body': post_data.decode('utf-8', errors='ignore')
-            }
-
-            # Send to Chrome extension via native messaging
-            response = send_to_extension(request_data)
+            body = await request.text() if request.can_read_body else ''
 
-            # Send response back to HTTP client
-            self.send_json_response(response.get('status', 200), response.get('body', {}))
-
-        except Exception as e:
-            logger.error(f"Error handling POST request: {e}")
-            self.send_json_response(500, {'error': str(e)})
-
-    def do_DELETE(self):
-        """Handle DELETE requests"""
-        try:
             request_data = {
                 'type': 'http_request',
-                'method': 'DELETE',
-                'path': self.path,
-                'headers': dict(self.headers),
-                'body': ''
+                'method': request.method,
+                'path': request.path_qs,
+                'headers': {
+                    k: request.headers[k] for k in FORWARDED_HEADERS if k in request.headers
+                },
+                'body': body,
             }
 
-            response = send_to_extension(request_data)
-            self.send_json_response(response.get('status', 200), response.get('body', {}))
+            response = await self.send_to_extension(request_data)
+            return json_response(response.get('status', 200), response.get('body', {}))
 
         except Exception as e:
-            logger.error(f"Error handling DELETE request: {e}")
-            self.send_json_response(500, {'error': str(e)})
+            logger.error(f"Error handling {request.method} request: {e}")
+            return json_response(500, {'error': str(e)})
 
-    def send_json_response(self, status_code, data):
-        """Send JSON response with appropriate headers"""
-        response_body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    # --- HTTP server lifecycle -----------------------------------------
 
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json; charset=utf-8')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-        self.send_header('Content-Length', str(len(response_body)))
-        self.end_headers()
+    async def start_http_server(self, port=8765):
+        """Start HTTP server on the running event loop"""
+        if self.runner is not None:
+            return True
 
-        self.wfile.write(response_body)
+        try:
+            app = web.Application()
+            app.router.add_route('OPTIONS', '/{tail:.*}', self.handle_options)
+            app.router.add_get('/{tail:.*}', self.handle_get)
+            app.router.add_post('/{tail:.*}', self.handle_http_request)
+            app.router.add_delete('/{tail:.*}', self.handle_http_request)
 
-def send_to_extension(data):
-    """Send message to Chrome extension and wait for response"""
-    try:
-        # Send message to extension
-        encoded = json.dumps(data).encode('utf-8')
-        sys.stdout.buffer.write(struct.pack('@I', len(encoded)))
-        sys.stdout.buffer.write(encoded)
-        sys.stdout.buffer.flush()
+            self.runner = web.AppRunner(app, keepalive_timeout=KEEPALIVE_TIMEOUT)
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, port=port)
+            await site.start()
 
-        # Read response length
-        text_length_bytes = sys.stdin.buffer.read(4)
-        if len(text_length_bytes) < 4:
-            raise Exception('Failed to read response length from extension')
+            logger.info(f"ChatGPT API server started on port {port}")
+            return True
 
-        text_length = struct.unpack('@I', text_length_bytes)[0]
+        except Exception as e:
+            logger.error(f"Failed to start HTTP server on port {port}: {e}")
+            self.runner = None
+            return False
 
-        # Read response data
-        response_bytes = sys.stdin.buffer.read(text_length)
-        if len(response_bytes) < text_length:
-            raise Exception('Failed to read complete response from extension')
+    async def stop_http_server(self):
+        """Stop HTTP server"""
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+        logger.info("HTTP server stopped")
+
+    # --- Native messaging pipe -----------------------------------------
+
+    def _read_message(self):
+        """Blocking read and parse of one framed message via the reusable
+        input buffer; runs in a worker thread.
+
+        Returns the decoded message, or None on EOF; raises ValueError on
+        malformed JSON. Parsing happens here so the memoryview over the
+        buffer can be released before returning — a view escaping this
+        function would make the bytearray un-growable for the next,
+        larger message (BufferError on extend).
+        """
+        stdin = sys.stdin.buffer
+        buf = self._inbuf
+
+        if stdin.readinto(memoryview(buf)[:4]) < 4:
+            return None  # EOF reached
+
+        text_length = _LEN.unpack_from(buf, 0)[0]
+        if text_length > len(buf):
+            buf.extend(b'\x00' * (text_length - len(buf)))
+
+        view = memoryview(buf)[:text_length]
+        try:
+            if stdin.readinto(view) < text_length:
+                return None
+            return _json_loads(view)
+        finally:
+            view.release()
+
+    def _write_message(self, encoded):
+        """Blocking write of one framed message; runs in a worker thread.
+
+        Length prefix and payload are packed into the reusable output buffer
+        and written in a single call, halving syscalls per message; the
+        flush is per drained batch since the writer task sends one framed
+        message per batch.
+        """
+        n = len(encoded)
+        buf = self._outbuf
+        if 4 + n > len(buf):
+            buf.extend(b'\x00' * (4 + n - len(buf)))
+
+        _LEN.pack_into(buf, 0, n)
+        buf[4:4 + n] = encoded
+        sys.stdout.buffer.write(memoryview(buf)[:4 + n])
+        sys.stdout.buffer.flush()
 
-        response = response_bytes.decode('utf-8')
-        return json.loads(response)
+    async def _send_message(self, data):
+        """Queue one message for the writer task"""
+        await self._send_queue.put(data)
+
+    async def _writer_loop(self):
+        """Sole stdout writer: drain the send queue, coalescing bursts.
+
+        After the first message arrives, up to MAX_BATCH more are pulled
+        within the batch window and sent as a single batch envelope, so N
+        concurrent requests pay one framing + write instead of N.
+        """
+        while True:
+            items = [await self._send_queue.get()]
+
+            # A window of 0 disables coalescing entirely: every message is
+            # sent in its own frame, even if more are already queued
+            if self.batch_window > 0:
+                deadline = self.loop.time() + self.batch_window
+                while len(items) < MAX_BATCH:
+                    try:
+                        items.append(self._send_queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+
+                    remaining = deadline - self.loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(self._send_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+            if len(items) == 1:
+                message = items[0]
+            else:
+                message = {'type': 'batch', 'items': items}
 
-    except Exception as e:
-        logger.error(f"Error communicating with extension: {e}")
-        return {
-            'status': 503,
-            'body': {'error': f'Extension communication error: {str(e)}'}
-        }
-
-def run_server(port=8765):
-    """Run HTTP server in a separate thread"""
-    try:
-        with socketserver.TCPServer(("", port), ChatGPTAPIHandler) as httpd:
-            logger.info(f"ChatGPT API server started on port {port}")
-            httpd.serve_forever()
-    except Exception as e:
-        logger.error(f"Failed to start HTTP server on port {port}: {e}")
-        sys.exit(1)
+            encoded = _json_dumps(message)
+            await asyncio.to_thread(self._write_message, encoded)
 
-class NativeMessagingHost:
-    def __init__(self):
-        self.server_thread = None
-        self.http_server = None
-        self.running = False
+    async def send_to_extension(self, data):
+        """Send message to Chrome extension and wait for response"""
+        request_id = next(self._next_id)
+        data['id'] = request_id
 
-    def start_http_server(self, port=8765):
-        """Start HTTP server in background thread"""
-        if self.server_thread and self.server_thread.is_alive():
-            return True
+        future = self.loop.create_future()
+        self._pending[request_id] = future
 
         try:
-            self.server_thread = threading.Thread(
-                target=run_server,
-                args=(port,),
-                daemon=True
-            )
-            self.server_thread.start()
-            time.sleep(0.5)  # Give server time to start
-
-            if self.server_thread.is_alive():
-                logger.info(f"HTTP server started successfully on port {port}")
-                return True
-            else:
-                logger.error("HTTP server failed to start")
-                return False
-
+            await self._send_message(data)
+            return await asyncio.wait_for(future, timeout=REQUEST_TIMEOUT)
         except Exception as e:
-            logger.error(f"Error starting HTTP server: {e}")
-            return False
+            logger.error(f"Error communicating with extension: {e}")
+            return {
+                'status': 503,
+                'body': {'error': f'Extension communication error: {str(e)}'}
+            }
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _dispatch(self, data):
+        """Route one incoming message: response to a pending request, or control"""
+        # The extension may answer a batch with an array (or batch envelope)
+        # of per-id responses; unwrap and dispatch each
+        if isinstance(data, list):
+            for item in data:
+                await self._dispatch(item)
+            return
+        if data.get('type') == 'batch':
+            for item in data.get('items', []):
+                await self._dispatch(item)
+            return
+
+        message_id = data.get('id')
+        future = self._pending.pop(message_id, None) if message_id is not None else None
+        if future is not None:
+            if not future.done():
+                future.set_result(data)
+            return
+
+        if data.get('type') == 'http_response':
+            # The matching request already timed out; drop the reply rather
+            # than bounce an 'unknown' error back at the extension
+            logger.warning(f"Dropping orphan http_response id={message_id}")
+            return
 
-    def stop_http_server(self):
-        """Stop HTTP server"""
-        # Note: Stopping the TCPServer gracefully would require additional implementation
-        logger.info("HTTP server stop requested")
+        try:
+            response = await self.handle_message(data)
+        except Exception as e:
+            logger.error(f"Error handling message: {e}")
+            response = {
+                'type': 'error',
+                'error': str(e)
+            }
+        await self._send_message(response)
 
-    def run_native_messaging_loop(self):
+    async def run_native_messaging_loop(self):
         """Main native messaging loop"""
         logger.info("Starting native messaging host")
+        self.loop = asyncio.get_running_loop()
+        self._send_queue = asyncio.Queue()
+        self._writer_task = self.loop.create_task(self._writer_loop())
         self.running = True
 
         try:
             while self.running:
-                # Read message length
-                text_length_bytes = sys.stdin.buffer.read(4)
-                if len(text_length_bytes) < 4:
-                    break  # EOF reached
-
-                text_length = struct.unpack('@I', text_length_bytes)[0]
-
-                # Read message content
-                message_bytes = sys.stdin.buffer.read(text_length)
-                if len(message_bytes) < text_length:
-                    break
-
-                message = message_bytes.decode('utf-8')
-
                 try:
-                    data = json.loads(message)
-                    response = self.handle_message(data)
-                except json.JSONDecodeError as e:
+                    data = await asyncio.to_thread(self._read_message)
+                except ValueError as e:
                     logger.error(f"JSON decode error: {e}")
-                    response = {
+                    await self._send_message({
                         'type': 'error',
                         'error': 'Invalid JSON format'
-                    }
-                except Exception as e:
-                    logger.error(f"Error handling message: {e}")
-                    response = {
-                        'type': 'error',
-                        'error': str(e)
-                    }
+                    })
+                    continue
 
-                # Send response back
-                encoded_response = json.dumps(response).encode('utf-8')
-                sys.stdout.buffer.write(struct.pack('@I', len(encoded_response)))
-                sys.stdout.buffer.write(encoded_response)
-                sys.stdout.buffer.flush()
+                if data is None:
+                    break  # EOF reached
+
+                await self._dispatch(data)
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
@@ -225,16 +351,17 @@ class NativeMessagingHost:
             logger.error(f"Error in native messaging loop: {e}")
         finally:
             self.running = False
-            self.stop_http_server()
+            self._writer_task.cancel()
+            await self.stop_http_server()
             logger.info("Native messaging host stopped")
 
-    def handle_message(self, data):
-        """Handle incoming messages from Chrome extension"""
+    async def handle_message(self, data):
+        """Handle incoming control messages from Chrome extension"""
         message_type = data.get('type', '')
 
         if message_type == 'start_server':
             port = data.get('port', 8765)
-            success = self.start_http_server(port)
+            success = await self.start_http_server(port)
             return {
                 'type': 'server_started',
                 'success': success,
@@ -242,7 +369,7 @@ class NativeMessagingHost:
             }
 
         elif message_type == 'stop_server':
-            self.stop_http_server()
+            await self.stop_http_server()
             return {
                 'type': 'server_stopped',
                 'success': True
@@ -260,16 +387,26 @@ class NativeMessagingHost:
                 'error': f'Unknown message type: {message_type}'
             }
 
+
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="ChatGPT API native messaging host")
+    parser.add_argument(
+        '--batch-window-ms',
+        type=float,
+        default=DEFAULT_BATCH_WINDOW_MS,
+        help="How long to wait for more outgoing messages before sending a batch (0 disables coalescing)",
+    )
+    args = parser.parse_args()
+
     logger.info("ChatGPT API Native Messaging Host starting...")
 
     try:
-        host = NativeMessagingHost()
-        host.run_native_messaging_loop()
+        host = NativeMessagingHost(batch_window_ms=args.batch_window_ms)
+        asyncio.run(host.run_native_messaging_loop())
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
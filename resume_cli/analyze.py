@@ -1,4 +1,6 @@
-from typing import Dict, List
+import re
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple
 
 ROLE_KEYWORDS = {
     "backend": ["python", "java", "go", "microservices", "api", "postgres", "redis", "aws"],
@@ -7,20 +9,67 @@ ROLE_KEYWORDS = {
     "devops": ["kubernetes", "docker", "terraform", "cicd", "aws", "gcp", "azure"],
 }
 
+# Keyword -> roles it counts toward (some keywords score for several roles)
+_KEYWORD_ROLES: Dict[str, List[str]] = {}
+for _role, _keywords in ROLE_KEYWORDS.items():
+    for _kw in _keywords:
+        _KEYWORD_ROLES.setdefault(_kw, []).append(_role)
 
-def analyze_resume(parsed: Dict) -> Dict:
+# One pass over the resume text scores every role at once. pyahocorasick
+# walks a C automaton; the regex fallback is a single compiled alternation.
+try:
+    import ahocorasick
+
+    _AUTOMATON = ahocorasick.Automaton()
+    for _kw, _roles in _KEYWORD_ROLES.items():
+        _AUTOMATON.add_word(_kw, (_kw, _roles))
+    _AUTOMATON.make_automaton()
+
+    def _iter_keyword_hits(text: str) -> Iterator[Tuple[str, List[str]]]:
+        for end, (kw, roles) in _AUTOMATON.iter(text):
+            start = end - len(kw) + 1
+            # Reject hits embedded in a longer token ("ml" in "html")
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end + 1 < len(text) and text[end + 1].isalnum():
+                continue
+            yield kw, roles
+except ImportError:
+    _KEYWORD_RE = re.compile(
+        r"(?<![a-z0-9])(?:"
+        + "|".join(sorted(map(re.escape, _KEYWORD_ROLES), key=len, reverse=True))
+        + r")(?![a-z0-9])"
+    )
+
+    def _iter_keyword_hits(text: str) -> Iterator[Tuple[str, List[str]]]:
+        for match in _KEYWORD_RE.finditer(text):
+            kw = match.group(0)
+            yield kw, _KEYWORD_ROLES[kw]
+
+
+def analyze_resume(parsed: Dict, text: str = "") -> Dict:
     skills = set(parsed.get("skills", []))
 
-    likely_roles = []
-    for role, keywords in ROLE_KEYWORDS.items():
-        score = sum(1 for k in keywords if k in skills)
-        if score >= 2:
-            likely_roles.append({"role": role, "score": score})
+    # Scan the raw text so multi-word keywords like "machine learning" can
+    # match; fall back to the tokenized skills when no text is available
+    haystack = text.lower() if text else " ".join(skills)
+
+    seen = set()
+    scores: Counter = Counter()
+    for kw, roles in _iter_keyword_hits(haystack):
+        if kw in seen:
+            continue
+        seen.add(kw)
+        scores.update(roles)
+
+    likely_roles = [
+        {"role": role, "score": score} for role, score in scores.items() if score >= 2
+    ]
 
     strengths = []
     if len(skills) >= 10:
         strengths.append("Breadth of skills")
-    if any(k in skills for k in ("python", "java", "react", "kubernetes")):
+    if any(k in seen for k in ("python", "java", "react", "kubernetes")):
         strengths.append("In-demand core technologies present")
 
     gaps = []
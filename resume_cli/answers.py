@@ -1,13 +1,20 @@
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import re
 import subprocess
 import json
+import urllib.error
+import urllib.request
 
 SYSTEM_PROMPT = (
     "You are an expert career coach. Given resume text, parsed fields, and insights, "
     "write concise, compelling interview answers with STAR where applicable."
 )
 
+OLLAMA_URL = "http://localhost:11434/api/generate"
+
+_ANSWER_SPLIT_RE = re.compile(r"^###\s*ANSWER\s+(\d+)\s*$", re.M)
+
 
 def _ollama_generate(prompt: str, model: str) -> str:
     try:
@@ -25,6 +32,63 @@ def _ollama_generate(prompt: str, model: str) -> str:
     return ""
 
 
+def _build_context(resume_text: str, parsed: Dict, insights: Dict) -> str:
+    """Build the prompt prefix shared by every question.
+
+    Serialized once per run; the per-question work is reduced to appending
+    the question itself.
+    """
+    return (
+        f"{SYSTEM_PROMPT}\n\n"
+        f"Resume text:\n{resume_text[:8000]}\n\n"
+        f"Parsed JSON:\n{json.dumps(parsed)[:6000]}\n\n"
+        f"Insights JSON:\n{json.dumps(insights)}\n\n"
+    )
+
+
+def _ollama_generate_batch(
+    questions: List[str],
+    context: str,
+    model: str,
+) -> Optional[List[Optional[str]]]:
+    """Answer all questions in one Ollama API call.
+
+    One call amortizes model load and KV-cache warmup across questions,
+    versus one process fork + warmup per question with `ollama run`.
+    Returns a list aligned with `questions` (entries may be None if the
+    model skipped one), or None if the API is unreachable or the response
+    could not be split per question.
+    """
+    numbered = "\n".join(f"{i + 1}. {q}" for i, q in enumerate(questions))
+    prompt = (
+        f"{context}"
+        f"Questions:\n{numbered}\n\n"
+        "Answer every question. Start each answer with a line containing exactly "
+        "'### ANSWER <number>' and nothing else. "
+        "Respond briefly (120-180 words each), concrete, with numbers when possible."
+    )
+    payload = json.dumps({"model": model, "prompt": prompt, "stream": False}).encode("utf-8")
+    request = urllib.request.Request(
+        OLLAMA_URL, data=payload, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=600) as response:
+            out = json.loads(response.read()).get("response", "")
+    except (urllib.error.URLError, ValueError, OSError):
+        return None
+
+    # split yields [prefix, number, text, number, text, ...]
+    parts = _ANSWER_SPLIT_RE.split(out)
+    answers: List[Optional[str]] = [None] * len(questions)
+    for number, chunk in zip(parts[1::2], parts[2::2]):
+        idx = int(number) - 1
+        if 0 <= idx < len(questions) and chunk.strip():
+            answers[idx] = chunk.strip()
+    if not any(answers):
+        return None
+    return answers
+
+
 def generate_answers(
     questions: List[str],
     resume_text: str,
@@ -36,17 +100,23 @@ def generate_answers(
     answers: Dict[str, str] = {}
     clarifying_questions: List[str] = []
 
-    for q in questions:
-        prompt = (
-            f"{SYSTEM_PROMPT}\n\n"
-            f"Question: {q}\n\n"
-            f"Resume text:\n{resume_text[:8000]}\n\n"
-            f"Parsed JSON:\n{json.dumps(parsed)[:6000]}\n\n"
-            f"Insights JSON:\n{json.dumps(insights)}\n\n"
-            "Respond briefly (120-180 words), concrete, with numbers when possible."
-        )
+    context = _build_context(resume_text, parsed, insights)
+
+    batch: Optional[List[Optional[str]]] = None
+    if use_ollama and questions:
+        batch = _ollama_generate_batch(questions, context, model)
+
+    for i, q in enumerate(questions):
         answer = ""
-        if use_ollama:
+        if batch is not None:
+            answer = batch[i] or ""
+        elif use_ollama:
+            # API unreachable; fall back to one `ollama run` per question
+            prompt = (
+                f"{context}"
+                f"Question: {q}\n\n"
+                "Respond briefly (120-180 words), concrete, with numbers when possible."
+            )
             answer = _ollama_generate(prompt, model)
         if not answer:
             # Template fallback
@@ -1,9 +1,27 @@
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import sys
+import hashlib
 import json
 import yaml
 import argparse
+
+# PyYAML's C loader is an order of magnitude faster than the pure-Python
+# default; not every wheel ships it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson serializes several times faster than stdlib json, pretty-printed or not
+try:
+    import orjson
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None).encode("utf-8")
 from rich.console import Console
 from rich.panel import Panel
 from .pdf_extract import extract_text_from_pdf
@@ -13,6 +31,31 @@ from .answers import generate_answers, write_clarifying_questions
 
 console = Console()
 
+_CACHE_ROOT = Path.home() / ".cache" / "resume_cli"
+
+
+def _load_cached_analysis(cache_dir: Path) -> Optional[Tuple[str, dict, dict, dict]]:
+    try:
+        text = (cache_dir / "resume_text.txt").read_text()
+        meta = json.loads((cache_dir / "resume_metadata.json").read_text())
+        data = json.loads((cache_dir / "parsed.json").read_text())
+        insights = json.loads((cache_dir / "insights.json").read_text())
+    except (OSError, ValueError):
+        return None
+    return text, meta, data, insights
+
+
+def _store_cached_analysis(cache_dir: Path, text: str, meta: dict, data: dict, insights: dict) -> None:
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / "resume_text.txt").write_text(text)
+        (cache_dir / "resume_metadata.json").write_bytes(_dumps(meta))
+        (cache_dir / "parsed.json").write_bytes(_dumps(data))
+        (cache_dir / "insights.json").write_bytes(_dumps(insights))
+    except OSError:
+        # Cache is best-effort; never fail the run over it
+        pass
+
 
 def cli_main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Analyze resume PDF and draft interview answers")
@@ -39,17 +82,30 @@ def cli_main(argv: Optional[list[str]] = None) -> int:
     out.mkdir(parents=True, exist_ok=True)
 
     console.rule("Resume Analyzer")
-    console.print(Panel.fit(f"Reading [bold]{resume}[/]"))
-    text, meta = extract_text_from_pdf(resume)
 
-    console.print(Panel.fit("Parsing resume"))
-    data = parse_resume(text)
+    # Re-runs with different --questions/--model are common; key the expensive
+    # PDF pipeline on the PDF's content hash (hashlib uses SHA-NI where available)
+    cache_key = hashlib.sha256(resume.read_bytes()).hexdigest()
+    cache_dir = _CACHE_ROOT / cache_key
+    cached = _load_cached_analysis(cache_dir)
+
+    if cached is not None:
+        console.print(Panel.fit(f"Using cached analysis for [bold]{resume}[/]"))
+        text, meta, data, insights = cached
+    else:
+        console.print(Panel.fit(f"Reading [bold]{resume}[/]"))
+        text, meta = extract_text_from_pdf(resume)
+
+        console.print(Panel.fit("Parsing resume"))
+        data = parse_resume(text)
+
+        console.print(Panel.fit("Analyzing resume"))
+        insights = analyze_resume(data, text)
 
-    console.print(Panel.fit("Analyzing resume"))
-    insights = analyze_resume(data)
+        _store_cached_analysis(cache_dir, text, meta, data, insights)
 
     console.print(Panel.fit("Loading questions"))
-    questions_list = yaml.safe_load(questions.read_text())
+    questions_list = yaml.load(questions.read_text(), Loader=_YamlLoader)
     if not isinstance(questions_list, list):
         console.print("[red]Questions YAML must be a list of strings[/]")
         return 2
@@ -59,11 +115,16 @@ def cli_main(argv: Optional[list[str]] = None) -> int:
         questions_list, resume_text=text, parsed=data, insights=insights, use_ollama=use_ollama, model=model
     )
 
-    (out / "resume_text.txt").write_text(text)
-    (out / "resume_metadata.json").write_text(json.dumps(meta, indent=2))
-    (out / "parsed.json").write_text(json.dumps(data, indent=2))
-    (out / "insights.json").write_text(json.dumps(insights, indent=2))
-    (out / "answers.json").write_text(json.dumps(answers, indent=2))
+    outputs = {
+        "resume_text.txt": text.encode("utf-8"),
+        "resume_metadata.json": _dumps(meta, pretty=True),
+        "parsed.json": _dumps(data, pretty=True),
+        "insights.json": _dumps(insights, pretty=True),
+        # machine-read; skipping pretty-printing roughly doubles serialize speed
+        "answers.json": _dumps(answers),
+    }
+    for name, payload in outputs.items():
+        (out / name).write_bytes(payload)
     write_clarifying_questions(clarifying_questions, out / "clarifying_questions.md")
 
     console.rule("Done")
@@ -1,39 +1,59 @@
 import re
 from typing import Dict, List
 
+# One alternation scans the text once for all contact fields; the winning
+# branch is identified by match.lastgroup
+_CONTACT_RE = re.compile(
+    r"(?P<email>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})"
+    r"|(?P<phone>(?:\+\d{1,3}[ -]?)?\(?\d{3}\)?[ -]?\d{3}[ -]?\d{4})"
+    r"|(?P<linkedin>linkedin\.com\/in\/[A-Za-z0-9_-]+)"
+    r"|(?P<github>github\.com\/[A-Za-z0-9._-]+)",
+    re.I,
+)
+_SKILL_TOKEN_RE = re.compile(r"[A-Za-z0-9+#.\-_/]{2,}")
+
+
+def _header_re(header: str) -> "re.Pattern[str]":
+    return re.compile(rf"^\s*(?:{header})\s*$", re.I | re.M)
+
+
+_SKILLS_HDR = _header_re("Skills|Technical Skills|Skills & Tools|Core Skills")
+_EXPERIENCE_HDR = _header_re("Experience|Professional Experience|Work Experience")
+_EDUCATION_HDR = _header_re("Education|Academic Background")
+_PROJECTS_HDR = _header_re("Projects|Selected Projects")
+
 
 def parse_resume(text: str) -> Dict:
     lines = [l.strip() for l in text.splitlines() if l.strip()]
     content = "\n".join(lines)
 
-    email_match = re.search(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", content)
-    phone_match = re.search(r"(?:\+\d{1,3}[ -]?)?(?:\(?\d{3}\)?[ -]?\d{3}[ -]?\d{4})", content)
-    linkedin_match = re.search(r"linkedin\.com\/in\/[A-Za-z0-9_-]+", content, re.I)
-    github_match = re.search(r"github\.com\/[A-Za-z0-9._-]+", content, re.I)
+    contact = {"email": None, "phone": None, "linkedin": None, "github": None}
+    remaining = len(contact)
+    for match in _CONTACT_RE.finditer(content):
+        group = match.lastgroup
+        if contact[group] is None:
+            contact[group] = match.group(0)
+            remaining -= 1
+            if not remaining:
+                break
 
     # Basic section splits
-    def section(header: str) -> str:
-        pattern = re.compile(rf"^\s*{header}\s*$", re.I | re.M)
+    def section(pattern: "re.Pattern[str]") -> str:
         parts = pattern.split(content)
         if len(parts) > 1:
             # Take everything after the header occurrence
             return parts[-1].strip()
         return ""
 
-    skills_block = section("Skills|Technical Skills|Skills & Tools|Core Skills")
-    experience_block = section("Experience|Professional Experience|Work Experience")
-    education_block = section("Education|Academic Background")
-    projects_block = section("Projects|Selected Projects")
+    skills_block = section(_SKILLS_HDR)
+    experience_block = section(_EXPERIENCE_HDR)
+    education_block = section(_EDUCATION_HDR)
+    projects_block = section(_PROJECTS_HDR)
 
-    skills = re.findall(r"[A-Za-z0-9+#.\-_/]{2,}", skills_block) if skills_block else []
+    skills = _SKILL_TOKEN_RE.findall(skills_block) if skills_block else []
 
     return {
-        "contact": {
-            "email": email_match.group(0) if email_match else None,
-            "phone": phone_match.group(0) if phone_match else None,
-            "linkedin": linkedin_match.group(0) if linkedin_match else None,
-            "github": github_match.group(0) if github_match else None,
-        },
+        "contact": contact,
         "skills": sorted(set(s.lower() for s in skills))[:200],
         "raw_sections": {
             "skills": skills_block,